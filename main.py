@@ -16,12 +16,14 @@ import os
 import sys
 import asyncio
 import argparse
+import random
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 import uuid
+from dataclasses import dataclass
 
-import yaml
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -32,14 +34,40 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.logger import setup_logger, get_logger
 from src.utils.database import Database
+from src.utils.llm_cache import LLMCache
+from src.utils.config import read_config
 from src.scraper import NewsAggregator
-from src.script_generator import ScriptWriter
+from src.script_generator import ScriptWriter, VideoScript
 from src.tts import TTSManager
 from src.avatar import AvatarGenerator
 from src.video import VideoComposer, ThumbnailGenerator
 from src.youtube import YouTubeUploader
 
 
+_LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "Hindi",
+    "ta": "Tamil",
+    "te": "Telugu"
+}
+
+
+# Step errors worth retrying: timeouts, dropped connections, rate limits
+# and server-side (5xx) failures. Anything else fails the step at once.
+_TRANSIENT_ERROR = re.compile(
+    r"time[sd]? ?out|connection|temporarily|unavailable|"
+    r"rate.?limit|too many requests|\b(?:408|429|5\d\d)\b",
+    re.IGNORECASE
+)
+
+
+@dataclass(frozen=True)
+class LanguageSpec:
+    """A supported video language, resolved once from config"""
+    code: str
+    name: str
+
+
 class VideoGenerationPipeline:
     """
     Main pipeline for generating current affairs videos.
@@ -54,6 +82,9 @@ class VideoGenerationPipeline:
     7. Upload to YouTube (optional)
     """
 
+    # Output directories already created by this process
+    _DIRS_READY: Set[str] = set()
+
     def __init__(self, config_path: str = "config/settings.yaml"):
         """
         Initialize the pipeline.
@@ -90,17 +121,27 @@ class VideoGenerationPipeline:
         self.video_dir = Path(self.config.get("paths", {}).get("videos", "output/videos"))
         self.thumbnail_dir = Path(self.config.get("paths", {}).get("thumbnails", "output/thumbnails"))
 
-        # Ensure directories exist
+        # Ensure directories exist (once per process)
         for dir_path in [self.output_dir, self.audio_dir, self.video_dir, self.thumbnail_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+            if str(dir_path) not in self._DIRS_READY:
+                dir_path.mkdir(parents=True, exist_ok=True)
+                self._DIRS_READY.add(str(dir_path))
+
+        # Generated scripts keyed by their inputs, reused on re-runs
+        self.script_cache = LLMCache(str(self.output_dir / ".script_cache"))
+
+        # Supported languages, keyed by code
+        self.languages = self._load_languages()
+
+        # Event loop reused by run_sync()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         self.logger.info("Pipeline initialized successfully")
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration file"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return read_config(config_path)
         except Exception as e:
             print(f"Warning: Failed to load config: {e}")
             return {}
@@ -124,7 +165,10 @@ class VideoGenerationPipeline:
         Returns:
             Dictionary with pipeline results
         """
-        video_id = f"video_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        # One clock read for the whole run, so the script date always
+        # matches the video id (even when a run straddles midnight)
+        now = datetime.now()
+        video_id = f"video_{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         self.logger.info(f"Starting pipeline: {video_id}")
 
         results = {
@@ -137,11 +181,14 @@ class VideoGenerationPipeline:
         # Will be set after video composition if PDF notes are generated
         pdf_notes_path = None
 
+        # Background thumbnail render, started once the script is ready
+        thumbnail_task: Optional[asyncio.Task] = None
+
         try:
             # Step 1: Scrape news
             self.logger.info("Step 1: Scraping news...")
             if scrape_fresh:
-                articles = self.scraper.scrape_all()
+                articles = await self.scraper.scrape_all_async()
             else:
                 articles = []
 
@@ -166,69 +213,44 @@ class VideoGenerationPipeline:
 
             # Step 2: Generate script
             self.logger.info("Step 2: Generating script...")
-            script = self.script_writer.generate_script(
-                articles=video_articles,
-                language=self._get_language_name(language),
-                date=datetime.now().strftime("%B %d, %Y")
+            language_name = self._get_language(language).name
+            script_date = now.strftime("%B %d, %Y")
+            cache_key = LLMCache.make_key(
+                articles=[a.url for a in video_articles],
+                language=language_name,
+                date=script_date,
+                provider=self.script_writer.llm.provider,
+                model=getattr(self.script_writer.llm.client, "model", ""),
+                duration=self.script_writer.target_duration,
+                upsc_mode=self.script_writer.upsc_mode
             )
 
+            cached_script = self.script_cache.get(cache_key)
+            if cached_script is not None:
+                script = VideoScript.from_dict(cached_script)
+                self.logger.info("Reusing cached script for this article set")
+            else:
+                script = self.script_writer.generate_script(
+                    articles=video_articles,
+                    language=language_name,
+                    date=script_date
+                )
+                self.script_cache.set(cache_key, script.to_dict())
+
             script_path = self.output_dir / f"{video_id}_script.txt"
             self.script_writer.save_script(script, str(script_path))
 
             results["steps"]["script"] = {
                 "word_count": script.word_count,
                 "duration_estimate": script.total_duration,
-                "path": str(script_path)
+                "path": str(script_path),
+                "title": script.title,
+                "cached": cached_script is not None
             }
             self.logger.info(f"Script generated: {script.word_count} words")
 
-            # Step 3: Generate audio (TTS)
-            self.logger.info("Step 3: Generating audio...")
-            audio_path = self.audio_dir / f"{video_id}_audio.mp3"
-
-            tts_result = await self.tts_manager.generate_audio(
-                text=script.get_script_for_tts(),
-                output_path=str(audio_path),
-                language=language
-            )
-
-            if not tts_result.success:
-                results["errors"].append(f"TTS failed: {tts_result.error}")
-                self.logger.error(f"TTS failed: {tts_result.error}")
-                return results
-
-            results["steps"]["audio"] = {
-                "duration": tts_result.duration,
-                "path": str(audio_path),
-                "voice": tts_result.voice.id
-            }
-            self.logger.info(f"Audio generated: {tts_result.duration:.1f}s")
-
-            # Step 4: Generate avatar video
-            self.logger.info("Step 4: Generating avatar video...")
-            avatar_path = self.video_dir / f"{video_id}_avatar.mp4"
-
-            avatar_result = self.avatar_generator.generate(
-                audio_path=str(audio_path),
-                output_path=str(avatar_path)
-            )
-
-            if not avatar_result.success:
-                results["errors"].append(f"Avatar generation failed: {avatar_result.error}")
-                self.logger.error(f"Avatar failed: {avatar_result.error}")
-                return results
-
-            results["steps"]["avatar"] = {
-                "duration": avatar_result.duration,
-                "path": str(avatar_path),
-                "method": avatar_result.method
-            }
-            self.logger.info(f"Avatar video generated: {avatar_result.method}")
-
-            # Step 5: Compose final video
-            self.logger.info("Step 5: Composing final video...")
-            final_video_path = self.video_dir / f"{video_id}_final.mp4"
-
+            # Step 6 (thumbnail) only needs the headlines and date, so start it
+            # now and let it render while audio, avatar and video are produced
             UPSC_KEYWORDS = {
                 # Polity & Governance
                 "parliament", "constitution", "supreme court", "high court", "lok sabha",
@@ -268,6 +290,71 @@ class VideoGenerationPipeline:
             # Fallback: if nothing passes the filter use all article titles
             if not headlines:
                 headlines = [a.title for a in video_articles]
+            results["steps"]["scraping"]["headlines"] = headlines
+
+            self.logger.info("Step 6: Generating thumbnail in the background...")
+            thumbnail_path = self.thumbnail_dir / f"{video_id}_thumbnail.png"
+            thumbnail_task = asyncio.create_task(asyncio.to_thread(
+                self.thumbnail_generator.generate_from_headlines,
+                output_path=str(thumbnail_path),
+                headlines=headlines,
+                date=script.date
+            ))
+
+            # Step 3: Generate audio (TTS)
+            self.logger.info("Step 3: Generating audio...")
+            audio_path = self.audio_dir / f"{video_id}_audio.mp3"
+
+            tts_text = script.get_script_for_tts()
+            tts_result = await self._with_retry(
+                "TTS",
+                lambda: self.tts_manager.generate_audio(
+                    text=tts_text,
+                    output_path=str(audio_path),
+                    language=language
+                )
+            )
+
+            if not tts_result.success:
+                results["errors"].append(f"TTS failed: {tts_result.error}")
+                self.logger.error(f"TTS failed: {tts_result.error}")
+                return results
+
+            results["steps"]["audio"] = {
+                "duration": tts_result.duration,
+                "path": str(audio_path),
+                "voice": tts_result.voice.id
+            }
+            self.logger.info(f"Audio generated: {tts_result.duration:.1f}s")
+
+            # Step 4: Generate avatar video
+            self.logger.info("Step 4: Generating avatar video...")
+            avatar_path = self.video_dir / f"{video_id}_avatar.mp4"
+
+            avatar_result = await self._with_retry(
+                "Avatar generation",
+                lambda: asyncio.to_thread(
+                    self.avatar_generator.generate,
+                    audio_path=str(audio_path),
+                    output_path=str(avatar_path)
+                )
+            )
+
+            if not avatar_result.success:
+                results["errors"].append(f"Avatar generation failed: {avatar_result.error}")
+                self.logger.error(f"Avatar failed: {avatar_result.error}")
+                return results
+
+            results["steps"]["avatar"] = {
+                "duration": avatar_result.duration,
+                "path": str(avatar_path),
+                "method": avatar_result.method
+            }
+            self.logger.info(f"Avatar video generated: {avatar_result.method}")
+
+            # Step 5: Compose final video
+            self.logger.info("Step 5: Composing final video...")
+            final_video_path = self.video_dir / f"{video_id}_final.mp4"
 
             # Build script_data dict so PDF notes are generated from the script
             script_data = {
@@ -287,7 +374,8 @@ class VideoGenerationPipeline:
                 'subjects_covered': script.subjects_covered,
             }
 
-            composition_result = self.video_composer.compose(
+            composition_result = await asyncio.to_thread(
+                self.video_composer.compose,
                 avatar_video_path=str(avatar_path),
                 output_path=str(final_video_path),
                 headlines=headlines,
@@ -314,33 +402,34 @@ class VideoGenerationPipeline:
             if pdf_notes_path:
                 self.logger.info(f"PDF study notes generated: {pdf_notes_path}")
 
-            # Step 6: Generate thumbnail
-            self.logger.info("Step 6: Generating thumbnail...")
-            thumbnail_path = self.thumbnail_dir / f"{video_id}_thumbnail.png"
-
-            thumbnail_result = self.thumbnail_generator.generate_from_headlines(
-                output_path=str(thumbnail_path),
-                headlines=headlines,
-                date=script.date
-            )
+            # Step 6: Collect thumbnail (started after the script step)
+            self.logger.info("Step 6: Waiting for thumbnail...")
+            try:
+                thumbnail_result = await thumbnail_task
+                thumbnail_ok = thumbnail_result.success
+            except Exception as e:
+                thumbnail_ok = False
+                results["errors"].append(f"Thumbnail generation failed: {e}")
+                self.logger.error(f"Thumbnail failed: {e}")
 
             results["steps"]["thumbnail"] = {
-                "success": thumbnail_result.success,
-                "path": str(thumbnail_path) if thumbnail_result.success else ""
+                "success": thumbnail_ok,
+                "path": str(thumbnail_path) if thumbnail_ok else ""
             }
 
             # Step 7: Upload to YouTube (if enabled)
             if upload:
                 self.logger.info("Step 7: Uploading to YouTube (with PDF study notes)...")
-                sources = list(set([a.source for a in video_articles]))
+                sources = list(dict.fromkeys(a.source for a in video_articles))
 
-                upload_result = self.youtube_uploader.upload_with_metadata(
+                upload_result = await asyncio.to_thread(
+                    self.youtube_uploader.upload_with_metadata,
                     video_path=str(final_video_path),
                     headlines=headlines,
                     sources=sources,
                     language=language,
                     date=script.date,
-                    thumbnail_path=str(thumbnail_path) if thumbnail_result.success else None,
+                    thumbnail_path=str(thumbnail_path) if thumbnail_ok else None,
                     privacy_status="private" if test_mode else "public",
                     pdf_path=pdf_notes_path
                 )
@@ -358,10 +447,8 @@ class VideoGenerationPipeline:
                     if pdf_notes_path:
                         self.logger.info(f"PDF study notes linked in description: {pdf_notes_path}")
 
-                    # Mark articles as used
-                    article_ids = [a.id for a in video_articles if hasattr(a, 'id')]
-                    if article_ids:
-                        self.db.mark_articles_used(article_ids, video_id)
+                    # Mark articles as used (NewsArticle has no DB id, so match by URL)
+                    self.db.mark_urls_used([a.url for a in video_articles], video_id)
                 else:
                     results["errors"].append(f"Upload failed: {upload_result.error}")
             else:
@@ -374,21 +461,111 @@ class VideoGenerationPipeline:
             self.logger.error(f"Pipeline failed: {e}")
             results["errors"].append(str(e))
 
+        finally:
+            # A run that stops before step 6 must not leave the thumbnail
+            # task pending, or its exception unretrieved, on the loop
+            if thumbnail_task is not None:
+                if not thumbnail_task.done():
+                    thumbnail_task.cancel()
+                await asyncio.gather(thumbnail_task, return_exceptions=True)
+
         return results
 
-    def _get_language_name(self, code: str) -> str:
-        """Get language name from code"""
-        names = {
-            "en": "English",
-            "hi": "Hindi",
-            "ta": "Tamil",
-            "te": "Telugu"
+    async def _with_retry(
+        self,
+        step: str,
+        attempt_fn,
+        attempts: int = 3,
+        base_delay: float = 2.0
+    ):
+        """
+        Run a pipeline step, retrying only transient failures with backoff.
+
+        Args:
+            step: Step name for logging
+            attempt_fn: Zero-argument callable returning an awaitable
+                result with success/error fields
+            attempts: Maximum number of attempts
+            base_delay: Backoff base; waits base_delay ** n seconds plus jitter
+
+        Returns:
+            Result of the last attempt. Only network exceptions and
+            failures matching _TRANSIENT_ERROR are retried.
+        """
+        for attempt in range(1, attempts + 1):
+            try:
+                result = await attempt_fn()
+            except (ConnectionError, TimeoutError, asyncio.TimeoutError) as e:
+                if attempt == attempts:
+                    raise
+                error = str(e) or type(e).__name__
+            else:
+                if result.success or attempt == attempts:
+                    return result
+                error = result.error or ""
+                if not _TRANSIENT_ERROR.search(error):
+                    return result
+
+            delay = base_delay ** (attempt - 1) + random.random()
+            self.logger.warning(
+                f"{step} failed (attempt {attempt}/{attempts}): {error}; "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def _load_languages(self) -> Dict[str, LanguageSpec]:
+        """Build language specs from config, on top of the built-in names"""
+        languages = {
+            code: LanguageSpec(code=code, name=name)
+            for code, name in _LANGUAGE_NAMES.items()
         }
-        return names.get(code, "English")
+
+        for lang in self.config.get("languages", {}).get("supported", []):
+            code = lang.get("code", "")
+            if code:
+                languages[code] = LanguageSpec(
+                    code=code,
+                    name=lang.get("name", _LANGUAGE_NAMES.get(code, code))
+                )
+
+        return languages
+
+    def _get_language(self, code: str) -> LanguageSpec:
+        """Get language spec from code (unknown codes are named English)"""
+        return self.languages.get(code) or LanguageSpec(code=code, name="English")
 
     def run_sync(self, **kwargs) -> Dict[str, Any]:
-        """Synchronous wrapper for run()"""
-        return asyncio.run(self.run(**kwargs))
+        """
+        Synchronous wrapper for run().
+
+        The event loop (and its default thread pool) is kept on the
+        pipeline and reused, so repeated scheduled runs don't rebuild it.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.run(**kwargs))
+
+    def close(self) -> None:
+        """
+        Shut down the event loop kept by run_sync().
+
+        Does the cleanup asyncio.run() would: cancels leftover tasks and
+        shuts down async generators and the default thread pool.
+        """
+        loop, self._loop = self._loop, None
+        if loop is None or loop.is_closed():
+            return
+
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            loop.close()
 
 
 def main():
@@ -448,43 +625,53 @@ Examples:
 
     pipeline = VideoGenerationPipeline(config_path=args.config)
 
-    results = pipeline.run_sync(
-        language=args.language,
-        upload=not args.no_upload,
-        test_mode=args.test,
-        scrape_fresh=not args.no_scrape
-    )
-
-    # Print results
-    print("\n" + "="*60)
-    print("  Pipeline Results")
-    print("="*60 + "\n")
+    try:
+        results = pipeline.run_sync(
+            language=args.language,
+            upload=not args.no_upload,
+            test_mode=args.test,
+            scrape_fresh=not args.no_scrape
+        )
+    finally:
+        pipeline.close()
+
+    # Print results (assembled first, then written in one go)
+    lines = [
+        "",
+        "=" * 60,
+        "  Pipeline Results",
+        "=" * 60,
+        "",
+    ]
 
     if results["success"]:
-        print("Status: SUCCESS\n")
+        lines.append("Status: SUCCESS\n")
 
         for step, info in results["steps"].items():
-            print(f"{step.upper()}:")
+            lines.append(f"{step.upper()}:")
             if isinstance(info, dict):
                 for key, value in info.items():
-                    print(f"  {key}: {value}")
+                    lines.append(f"  {key}: {value}")
             else:
-                print(f"  {info}")
-            print()
+                lines.append(f"  {info}")
+            lines.append("")
 
         if results["steps"].get("upload", {}).get("url"):
-            print(f"\nVideo URL: {results['steps']['upload']['url']}")
+            lines.append(f"\nVideo URL: {results['steps']['upload']['url']}")
 
         if results["steps"].get("composition", {}).get("pdf_notes"):
-            print(f"PDF Notes: {results['steps']['composition']['pdf_notes']}")
+            lines.append(f"PDF Notes: {results['steps']['composition']['pdf_notes']}")
 
     else:
-        print("Status: FAILED\n")
-        print("Errors:")
+        lines.append("Status: FAILED\n")
+        lines.append("Errors:")
         for error in results["errors"]:
-            print(f"  - {error}")
+            lines.append(f"  - {error}")
+
+    lines.append("\n" + "=" * 60 + "\n")
 
-    print("\n" + "="*60 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
     return 0 if results["success"] else 1
 
@@ -10,27 +10,44 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
-
-import yaml
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.logger import setup_logger, get_logger
 from src.utils.scheduler import TaskScheduler
+from src.utils.config import read_config
 from main import VideoGenerationPipeline
 
 
 def load_config(config_path: str = "config/settings.yaml") -> dict:
     """Load configuration"""
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return read_config(config_path)
     except Exception as e:
         print(f"Warning: Failed to load config: {e}")
         return {}
 
 
+# Pipeline is built once per process and reused by every scheduled run
+_PIPELINE: Optional[VideoGenerationPipeline] = None
+
+
+def get_pipeline() -> VideoGenerationPipeline:
+    """Get the shared pipeline, building it on first use"""
+    global _PIPELINE
+    if _PIPELINE is None:
+        _PIPELINE = VideoGenerationPipeline()
+    return _PIPELINE
+
+
+def close_pipeline() -> None:
+    """Release the shared pipeline's event loop"""
+    if _PIPELINE is not None:
+        _PIPELINE.close()
+
+
 def generate_video_task(language: str = "en", upload: bool = True):
     """Task function for scheduled video generation"""
     logger = get_logger("ScheduledTask")
@@ -38,7 +55,7 @@ def generate_video_task(language: str = "en", upload: bool = True):
     try:
         logger.info(f"Starting scheduled video generation: language={language}")
 
-        pipeline = VideoGenerationPipeline()
+        pipeline = get_pipeline()
         results = pipeline.run_sync(
             language=language,
             upload=upload,
@@ -120,6 +137,7 @@ def main():
             language=args.language,
             upload=not args.no_upload
         )
+        close_pipeline()
         return 0
 
     # Parse time
@@ -149,6 +167,13 @@ def main():
     print(f"  Upload: {not args.no_upload}")
     print()
 
+    # Warm start: load models and clients now rather than at the first run
+    print("Initializing pipeline...\n")
+    try:
+        get_pipeline()
+    except Exception as e:
+        logger.warning(f"Pipeline warm start failed, will retry at first run: {e}")
+
     # Run immediately if requested
     if args.run_now:
         print("Running immediately...\n")
@@ -168,6 +193,8 @@ def main():
         scheduler.start()
     except KeyboardInterrupt:
         print("\nScheduler stopped.")
+    finally:
+        close_pipeline()
 
     return 0
 
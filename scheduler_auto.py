@@ -13,6 +13,7 @@ Usage:
 import os
 import sys
 import argparse
+import asyncio
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -23,7 +24,7 @@ import yaml
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from apscheduler.schedulers.blocking import BlockingScheduler
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from src.utils.logger import setup_logger, get_logger
@@ -33,6 +34,15 @@ from src.youtube.metadata import MetadataGenerator
 
 # Global state file to track pending uploads
 STATE_FILE = "data/scheduler_state.json"
+_STATE_PATH = Path(STATE_FILE)
+_STATE_TMP_PATH = _STATE_PATH.with_name(_STATE_PATH.name + ".tmp")
+
+# Jobs share one event loop, so a long generation can delay the next job;
+# allow it to start late instead of being skipped as misfired
+MISFIRE_GRACE_SECONDS = 3600
+
+# Shared stand-in for pipeline steps missing from the results
+_EMPTY: Dict[str, Any] = {}
 
 
 class AutoScheduler:
@@ -57,32 +67,50 @@ class AutoScheduler:
         self.timezone = timezone
         self.language = language
 
-        self.scheduler = BlockingScheduler(timezone=timezone)
+        # Jobs are coroutines run on this loop, so the pipeline is awaited
+        # directly instead of spinning up an event loop per trigger
+        self._loop = asyncio.new_event_loop()
+        self.scheduler = AsyncIOScheduler(timezone=timezone, event_loop=self._loop)
         self.logger = get_logger("AutoScheduler")
 
         # Ensure state directory exists
-        Path(STATE_FILE).parent.mkdir(parents=True, exist_ok=True)
+        _STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+        # YouTube clients, created on first upload and then reused
+        self._uploader: Optional[YouTubeUploader] = None
+        self._metadata_gen: Optional[MetadataGenerator] = None
+
+        # State is read once and kept in memory; mutations are persisted
+        self._state = self._load_state()
 
     def _load_state(self) -> Dict[str, Any]:
         """Load scheduler state"""
         try:
-            if Path(STATE_FILE).exists():
-                with open(STATE_FILE, "r") as f:
+            if _STATE_PATH.is_file():
+                with open(_STATE_PATH, "r") as f:
                     return json.load(f)
         except Exception as e:
             self.logger.warning(f"Failed to load state: {e}")
         return {"pending_upload": None}
 
-    def _save_state(self, state: Dict[str, Any]):
-        """Save scheduler state"""
+    def _persist_state(self):
+        """Atomically write the in-memory scheduler state to disk"""
         try:
-            with open(STATE_FILE, "w") as f:
-                json.dump(state, f, indent=2, default=str)
+            with open(_STATE_TMP_PATH, "w") as f:
+                json.dump(self._state, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(_STATE_TMP_PATH, _STATE_PATH)
         except Exception as e:
             self.logger.error(f"Failed to save state: {e}")
 
-    def generate_video_task(self):
-        """Task: Generate UPSC video and PDF notes"""
+    async def generate_video_task(self) -> bool:
+        """
+        Task: Generate UPSC video and PDF notes.
+
+        Returns:
+            True if a video was generated and queued for upload
+        """
         self.logger.info("="*50)
         self.logger.info("Starting video generation task")
         self.logger.info("="*50)
@@ -90,7 +118,7 @@ class AutoScheduler:
         try:
             # Run video generation pipeline
             pipeline = VideoGenerationPipeline()
-            results = pipeline.run_sync(
+            results = await pipeline.run(
                 language=self.language,
                 upload=False,  # Don't upload yet
                 test_mode=False,
@@ -99,27 +127,34 @@ class AutoScheduler:
 
             if results["success"]:
                 # Save video details for upload task
+                steps = results["steps"]
+                composition = steps.get("composition") or _EMPTY
+                thumbnail = steps.get("thumbnail") or _EMPTY
+                scraping = steps.get("scraping") or _EMPTY
+                script = steps.get("script") or _EMPTY
+                now = datetime.now()
+
                 video_data = {
-                    "video_path": results["steps"].get("composition", {}).get("video_path", ""),
-                    "thumbnail_path": results["steps"].get("thumbnail", {}).get("path", ""),
-                    "pdf_path": results["steps"].get("composition", {}).get("pdf_notes_path", ""),
-                    "headlines": results["steps"].get("scraping", {}).get("headlines", []),
-                    "title": results["steps"].get("script", {}).get("title", ""),
-                    "date": datetime.now().strftime("%B %d, %Y"),
+                    "video_path": composition.get("path", ""),
+                    "thumbnail_path": thumbnail.get("path", ""),
+                    "pdf_path": composition.get("pdf_notes", ""),
+                    "headlines": scraping.get("headlines", []),
+                    "title": script.get("title", ""),
+                    "date": now.strftime("%B %d, %Y"),
                     "language": self.language,
-                    "generated_at": datetime.now().isoformat(),
-                    "duration": results["steps"].get("composition", {}).get("duration", 0)
+                    "generated_at": now.isoformat(),
+                    "duration": composition.get("duration", 0)
                 }
 
-                state = self._load_state()
-                state["pending_upload"] = video_data
-                self._save_state(state)
+                self._state["pending_upload"] = video_data
+                self._persist_state()
 
                 self.logger.info(f"Video generated successfully!")
                 self.logger.info(f"  Path: {video_data['video_path']}")
                 self.logger.info(f"  PDF Notes: {video_data['pdf_path']}")
                 self.logger.info(f"  Duration: {video_data['duration']:.1f}s")
                 self.logger.info(f"Scheduled for upload at {self.upload_time}")
+                return True
 
             else:
                 self.logger.error(f"Video generation failed: {results.get('errors', [])}")
@@ -129,7 +164,9 @@ class AutoScheduler:
             import traceback
             traceback.print_exc()
 
-    def upload_video_task(self):
+        return False
+
+    async def upload_video_task(self):
         """Task: Upload pending video to YouTube"""
         self.logger.info("="*50)
         self.logger.info("Starting YouTube upload task")
@@ -137,29 +174,39 @@ class AutoScheduler:
 
         try:
             # Load pending video
-            state = self._load_state()
-            video_data = state.get("pending_upload")
+            video_data = self._state.get("pending_upload")
 
             if not video_data:
                 self.logger.warning("No pending video to upload")
                 return
 
             video_path = video_data.get("video_path", "")
-            if not video_path or not Path(video_path).exists():
+            try:
+                video_size = os.stat(video_path).st_size if video_path else 0
+            except OSError:
                 self.logger.error(f"Video file not found: {video_path}")
                 return
 
-            # Initialize uploader
-            uploader = YouTubeUploader()
+            if not video_size:
+                # A missing path or zero-byte render would only waste upload quota
+                self.logger.error(f"Video file is empty or missing: {video_path}")
+                return
+
+            # Initialize uploader (reused across runs)
+            if self._uploader is None:
+                self._uploader = YouTubeUploader()
+            uploader = self._uploader
 
             # Prepare metadata
             headlines = video_data.get("headlines", [])
-            date = video_data.get("date", datetime.now().strftime("%B %d, %Y"))
+            # Only fall back to today when the generation task left no date
+            date = video_data.get("date") or datetime.now().strftime("%B %d, %Y")
             pdf_path = video_data.get("pdf_path", "")
 
             # Generate optimized metadata
-            metadata_gen = MetadataGenerator()
-            metadata = metadata_gen.generate(
+            if self._metadata_gen is None:
+                self._metadata_gen = MetadataGenerator()
+            metadata = self._metadata_gen.generate(
                 headlines=headlines,
                 date=date,
                 language=video_data.get("language", "en")
@@ -167,20 +214,26 @@ class AutoScheduler:
 
             # Add PDF notes link to description
             description = metadata["description"]
-            if pdf_path and Path(pdf_path).exists():
+            if pdf_path and os.path.isfile(pdf_path):
                 description += f"\n\n📚 PDF Notes: Available in pinned comment"
 
+            thumbnail_path = video_data.get("thumbnail_path") or None
+            if thumbnail_path and not os.path.isfile(thumbnail_path):
+                self.logger.warning(f"Thumbnail not found, uploading without it: {thumbnail_path}")
+                thumbnail_path = None
+
             # Upload video
             self.logger.info(f"Uploading: {metadata['title']}")
 
-            result = uploader.upload(
+            result = await asyncio.to_thread(
+                uploader.upload,
                 video_path=video_path,
                 title=metadata["title"],
                 description=description,
                 tags=metadata["tags"],
                 category_id=metadata["category_id"],
                 privacy_status="public",
-                thumbnail_path=video_data.get("thumbnail_path"),
+                thumbnail_path=thumbnail_path,
                 made_for_kids=False
             )
 
@@ -192,14 +245,14 @@ class AutoScheduler:
                 self.logger.info("="*50)
 
                 # Clear pending upload
-                state["pending_upload"] = None
-                state["last_upload"] = {
+                self._state["pending_upload"] = None
+                self._state["last_upload"] = {
                     "video_id": result.video_id,
                     "url": result.video_url,
                     "title": result.title,
                     "uploaded_at": datetime.now().isoformat()
                 }
-                self._save_state(state)
+                self._persist_state()
 
             else:
                 self.logger.error(f"Upload failed: {result.error}")
@@ -220,7 +273,8 @@ class AutoScheduler:
             self.generate_video_task,
             CronTrigger(hour=gen_hour, minute=gen_minute, timezone=self.timezone),
             id="generate_video",
-            name="Generate UPSC Video"
+            name="Generate UPSC Video",
+            misfire_grace_time=MISFIRE_GRACE_SECONDS
         )
 
         # Add upload job
@@ -228,26 +282,38 @@ class AutoScheduler:
             self.upload_video_task,
             CronTrigger(hour=upload_hour, minute=upload_minute, timezone=self.timezone),
             id="upload_video",
-            name="Upload to YouTube"
+            name="Upload to YouTube",
+            misfire_grace_time=MISFIRE_GRACE_SECONDS
         )
 
         self.logger.info(f"Scheduled jobs:")
         self.logger.info(f"  Generate Video: {self.generate_time} ({self.timezone})")
         self.logger.info(f"  Upload Video:   {self.upload_time} ({self.timezone})")
 
-    def run_now(self, skip_upload: bool = False):
+    async def run_now(self, skip_upload: bool = False):
         """Run the full workflow immediately"""
         self.logger.info("Running workflow immediately...")
 
-        # Generate video
-        self.generate_video_task()
+        # Generate video, then upload straight away once it is queued
+        generated = await self.generate_video_task()
 
-        # Upload if requested
-        if not skip_upload:
-            self.logger.info("Waiting 30 seconds before upload...")
-            import time
-            time.sleep(30)
-            self.upload_video_task()
+        if generated and not skip_upload:
+            await self.upload_video_task()
+
+    def run_once(self, coro):
+        """Run a one-off task on the scheduler's event loop, then close the loop"""
+        try:
+            return self._loop.run_until_complete(coro)
+        finally:
+            self._close_loop()
+
+    def _close_loop(self):
+        """Shut down async generators and worker threads, then close the loop"""
+        try:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+        finally:
+            self._loop.close()
 
     def start(self):
         """Start the scheduler"""
@@ -263,13 +329,20 @@ class AutoScheduler:
         print("\n  Press Ctrl+C to stop\n")
         print("="*60 + "\n")
 
+        asyncio.set_event_loop(self._loop)
+        self.scheduler.start()
+
         try:
-            self.scheduler.start()
-        except KeyboardInterrupt:
+            self._loop.run_forever()
+        except (KeyboardInterrupt, SystemExit):
             print("\nScheduler stopped.")
+        finally:
+            self.scheduler.shutdown(wait=False)
+            self._close_loop()
 
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(
         description="UPSC Video Auto Scheduler - Generate at 10AM, Upload at 11AM"
     )
@@ -321,7 +394,14 @@ def main():
         help="Upload any pending video from previous generation"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
 
     # Setup logging
     setup_logger(log_level="INFO", log_file="logs/auto_scheduler.log")
@@ -335,11 +415,11 @@ def main():
     )
 
     if args.run_now:
-        scheduler.run_now(skip_upload=False)
+        scheduler.run_once(scheduler.run_now(skip_upload=False))
     elif args.generate_only:
-        scheduler.generate_video_task()
+        scheduler.run_once(scheduler.generate_video_task())
     elif args.upload_pending:
-        scheduler.upload_video_task()
+        scheduler.run_once(scheduler.upload_video_task())
     else:
         scheduler.start()
 
@@ -12,32 +12,56 @@ GitHub Secret names required:
   YOUTUBE_CLIENT_SECRETS  <- content of config/client_secrets.json (raw JSON or base64)
 """
 
+import sys
 import json
 import base64
 from pathlib import Path
+from typing import Callable
 
+TOKEN_FIELDS = ("token", "refresh_token", "token_uri", "client_id", "client_secret")
+CLIENT_SECRETS_KEYS = ("installed", "web")
 
-def validate_and_encode(file_path: str, required_fields: list) -> tuple[bool, str]:
+
+def _validate_token(data: dict) -> bool:
+    return all(data.get(k) for k in TOKEN_FIELDS)
+
+
+def _validate_client_secrets(data: dict) -> bool:
+    return any(k in data for k in CLIENT_SECRETS_KEYS)
+
+
+def validate_and_encode(
+    file_path: str,
+    validate: Callable[[dict], bool],
+    warning: str
+) -> tuple[bool, bytes]:
     path = Path(file_path)
     if not path.exists():
         print(f"  ERROR: File not found: {file_path}")
-        return False, ""
+        return False, b""
 
     try:
         with open(path, "r", encoding="utf-8-sig") as f:
             data = json.load(f)
     except json.JSONDecodeError as e:
         print(f"  ERROR: Invalid JSON in {file_path}: {e}")
-        return False, ""
+        return False, b""
 
-    missing = [k for k in required_fields if not data.get(k)]
-    if missing:
-        print(f"  WARNING: Missing fields in {file_path}: {missing}")
+    if not isinstance(data, dict) or not validate(data):
+        print(f"  WARNING: {file_path} {warning}")
 
     # Re-serialize to compact single-line JSON (safest for secrets)
-    compact_json = json.dumps(data, separators=(",", ":"))
-    b64_value = base64.b64encode(compact_json.encode("utf-8")).decode("ascii")
-    return True, b64_value
+    # Kept as bytes and written straight to stdout, skipping an ASCII decode copy
+    compact_json = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return True, base64.b64encode(compact_json)
+
+
+def print_secret(b64_value: bytes) -> None:
+    sys.stdout.write("  ")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(b64_value)
+    sys.stdout.buffer.flush()
+    sys.stdout.write("\n\n")
 
 
 def main():
@@ -48,35 +72,28 @@ def main():
     print("\n[1] YOUTUBE_TOKEN (config/youtube_token.json)")
     ok, b64 = validate_and_encode(
         "config/youtube_token.json",
-        ["token", "refresh_token", "token_uri", "client_id", "client_secret"]
+        _validate_token,
+        f"needs non-empty fields: {list(TOKEN_FIELDS)}"
     )
     if ok:
         print("  Status: VALID")
         print(f"\n  Store this as YOUTUBE_TOKEN in GitHub Secrets:\n")
-        print(f"  {b64}\n")
+        print_secret(b64)
     else:
         print("  Fix the token file first (run: python -m src.youtube.auth --auth)")
 
     print("\n[2] YOUTUBE_CLIENT_SECRETS (config/client_secrets.json)")
     ok2, b64_2 = validate_and_encode(
         "config/client_secrets.json",
-        ["installed", "web"]  # one of these should exist
+        _validate_client_secrets,
+        f"needs one of: {list(CLIENT_SECRETS_KEYS)}"
     )
-    # client_secrets has nested structure, just check it loaded
-    path = Path("config/client_secrets.json")
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8-sig") as f:
-                data = json.load(f)
-            compact_json = json.dumps(data, separators=(",", ":"))
-            b64_2 = base64.b64encode(compact_json.encode("utf-8")).decode("ascii")
-            print("  Status: VALID")
-            print(f"\n  Store this as YOUTUBE_CLIENT_SECRETS in GitHub Secrets:\n")
-            print(f"  {b64_2}\n")
-        except json.JSONDecodeError as e:
-            print(f"  ERROR: Invalid JSON: {e}")
+    if ok2:
+        print("  Status: VALID")
+        print(f"\n  Store this as YOUTUBE_CLIENT_SECRETS in GitHub Secrets:\n")
+        print_secret(b64_2)
     else:
-        print("  ERROR: File not found. Download from Google Cloud Console.")
+        print("  Download client_secrets.json from Google Cloud Console.")
 
     print("=" * 60)
     print("Steps to update GitHub Secrets:")
@@ -7,10 +7,15 @@ Run: python setup.py
 
 import os
 import sys
+import json
+import hashlib
 import subprocess
 import shutil
 from pathlib import Path
 
+# Remembers what a previous setup run already did
+SETUP_STATE_FILE = Path("data/setup_state.json")
+
 
 def print_header(text):
     """Print a formatted header"""
@@ -25,22 +30,26 @@ def print_step(number, text):
     print("-" * 40)
 
 
-def run_command(cmd, description=""):
-    """Run a command and return success status"""
+def run_command(args, description=""):
+    """Run a command given as an argv list (no shell) and return success status"""
     if description:
         print(f"  {description}...")
 
     try:
+        # Only stderr is kept, to explain a failure; stdout is discarded
         result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True
         )
-        return result.returncode == 0
     except Exception:
         return False
 
+    if result.returncode != 0 and result.stderr:
+        print("  " + "\n  ".join(result.stderr.strip().splitlines()[-5:]))
+    return result.returncode == 0
+
 
 def check_python():
     """Check Python version"""
@@ -102,12 +111,44 @@ def create_env_file():
         print("  .env.example not found, skipping")
 
 
+def load_setup_state():
+    """Load state saved by a previous setup run"""
+    try:
+        with open(SETUP_STATE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_setup_state(state):
+    """Save setup state for the next run"""
+    SETUP_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(SETUP_STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+
+def requirements_fingerprint():
+    """Identify requirements.txt contents plus the interpreter they go into"""
+    try:
+        digest = hashlib.sha256(Path("requirements.txt").read_bytes()).hexdigest()
+    except OSError:
+        return ""
+    return f"{sys.executable}:{digest}"
+
+
 def install_dependencies():
     """Install Python dependencies"""
     print("  This may take several minutes...\n")
 
+    # Prefer uv's much faster resolver when it is installed; fall back to pip
+    uv = shutil.which("uv")
+    if uv:
+        cmd = [uv, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"]
+    else:
+        cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+
     # Core dependencies
-    if not run_command("pip install -r requirements.txt", "Installing dependencies"):
+    if not run_command(cmd, "Installing dependencies" + (" with uv" if uv else "")):
         print("  Failed to install dependencies")
         return False
 
@@ -148,30 +189,21 @@ def check_youtube_credentials():
 
 
 def create_default_avatar():
-    """Create a simple default avatar"""
-    try:
-        from PIL import Image, ImageDraw
-
-        avatar_path = Path("assets/avatars/news_anchor.png")
-
-        if avatar_path.exists():
-            print("  Default avatar: Already exists")
-            return
+    """Install the bundled placeholder avatar if none exists"""
+    avatar_path = Path("assets/avatars/news_anchor.png")
 
-        # Create simple avatar placeholder
-        size = 512
-        img = Image.new('RGB', (size, size), color='#1a1a2e')
-        draw = ImageDraw.Draw(img)
+    if avatar_path.exists():
+        print("  Default avatar: Already exists")
+        return
 
-        # Simple silhouette
-        draw.ellipse([size//2-80, size//3-80, size//2+80, size//3+80], fill='#4a4a6a')
-        draw.rectangle([size//2-100, size//3+80, size//2+100, size], fill='#3a3a5a')
+    default_avatar = Path(__file__).parent / "assets/defaults/news_anchor.png"
+    if not default_avatar.exists():
+        print("  Default avatar: Skipped (assets/defaults/news_anchor.png missing)")
+        return
 
-        img.save(str(avatar_path))
-        print("  Default avatar: Created")
-
-    except ImportError:
-        print("  Default avatar: Skipped (Pillow not installed)")
+    avatar_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(default_avatar, avatar_path)
+    print("  Default avatar: Created")
 
 
 def main():
@@ -198,11 +230,19 @@ def main():
 
     # Step 5: Install dependencies
     print_step(5, "Installing Python dependencies")
-    response = input("  Install dependencies now? [Y/n]: ").strip().lower()
-    if response != 'n':
-        if not install_dependencies():
-            print("\nFailed to install dependencies. Try manually:")
-            print("  pip install -r requirements.txt")
+    setup_state = load_setup_state()
+    fingerprint = requirements_fingerprint()
+    if fingerprint and setup_state.get("requirements") == fingerprint:
+        print("  requirements.txt unchanged since last install, skipping")
+    else:
+        response = input("  Install dependencies now? [Y/n]: ").strip().lower()
+        if response != 'n':
+            if install_dependencies():
+                setup_state["requirements"] = fingerprint
+                save_setup_state(setup_state)
+            else:
+                print("\nFailed to install dependencies. Try manually:")
+                print("  pip install -r requirements.txt")
 
     # Step 6: Create default avatar
     print_step(6, "Creating default avatar")
@@ -2,18 +2,18 @@
 News Aggregator - Combines and manages multiple news sources
 """
 
+import asyncio
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from difflib import SequenceMatcher
 
-import yaml
-
 from .base_scraper import NewsArticle
 from .rss_scraper import RSSScraper
 from .web_scraper import WebScraper
 from src.utils.logger import get_logger
+from src.utils.config import load_yaml
 from src.utils.database import Database
 
 logger = get_logger(__name__)
@@ -59,8 +59,7 @@ class NewsAggregator:
             logger.error(f"Config file not found: {self.sources_config_path}")
             return {}
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml(config_path)
 
     def _init_scrapers(self) -> List:
         """Initialize all scrapers from configuration"""
@@ -125,41 +124,140 @@ class NewsAggregator:
             List of deduplicated NewsArticle objects
         """
         all_articles = []
-        stats = {
-            "total_found": 0,
-            "duplicates_removed": 0,
-            "sources_succeeded": 0,
-            "sources_failed": 0
-        }
+        stats = self._new_scrape_stats()
 
         logger.info(f"Starting scrape of {len(self.scrapers)} sources")
 
         for scraper in self.scrapers:
             try:
                 articles = scraper.scrape()
-                stats["total_found"] += len(articles)
-                stats["sources_succeeded"] += 1
+            except Exception as e:
+                articles = e
 
-                # Add to collection
-                all_articles.extend(articles)
+            all_articles.extend(self._record_scrape(scraper, articles, stats))
 
-                # Log scraping result
-                self.db.log_scraping(
-                    source=scraper.name,
-                    articles_found=len(articles),
-                    status="completed"
-                )
+        return self._finish_scrape(all_articles, stats)
+
+    async def scrape_all_async(
+        self,
+        max_concurrency: int = 8,
+        timeout: Optional[float] = None
+    ) -> List[NewsArticle]:
+        """
+        Scrape all configured news sources concurrently.
+
+        The scrapers are blocking (requests, feedparser, newspaper), so each
+        source runs in a worker thread; a semaphore bounds how many sources
+        are fetched at once. Each source is logged as soon as it finishes,
+        and sources still running when the timeout expires are logged as
+        failed and dropped. Articles are deduplicated in source order, so
+        the result matches scrape_all() for the sources that completed.
 
+        Args:
+            max_concurrency: Maximum number of sources scraped at once
+            timeout: Overall time limit in seconds (defaults to the
+                max_scrape_seconds rule; None means no limit)
+
+        Returns:
+            List of deduplicated NewsArticle objects
+        """
+        if timeout is None:
+            timeout = self.config.get("rules", {}).get("max_scrape_seconds")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scrape_one(index, scraper):
+            try:
+                async with semaphore:
+                    return index, await asyncio.to_thread(scraper.scrape)
             except Exception as e:
-                stats["sources_failed"] += 1
-                logger.error(f"Scraper {scraper.name} failed: {e}")
+                return index, e
 
-                self.db.log_scraping(
-                    source=scraper.name,
-                    status="failed",
-                    errors=str(e)
-                )
+        logger.info(
+            f"Starting concurrent scrape of {len(self.scrapers)} sources "
+            f"(max {max_concurrency} at once)"
+        )
+
+        tasks = [
+            asyncio.create_task(scrape_one(index, scraper))
+            for index, scraper in enumerate(self.scrapers)
+        ]
+        per_source = {}
+        stats = self._new_scrape_stats()
+
+        try:
+            for next_done in asyncio.as_completed(tasks, timeout=timeout):
+                index, articles = await next_done
+                per_source[index] = self._record_scrape(self.scrapers[index], articles, stats)
+        except asyncio.TimeoutError:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            for index, task in enumerate(tasks):
+                if index in per_source:
+                    continue
+                if task.cancelled():
+                    articles = TimeoutError(f"timed out after {timeout}s")
+                else:
+                    _, articles = task.result()
+                per_source[index] = self._record_scrape(self.scrapers[index], articles, stats)
+
+        all_articles = [
+            article
+            for index in range(len(self.scrapers))
+            for article in per_source[index]
+        ]
+
+        return self._finish_scrape(all_articles, stats)
+
+    @staticmethod
+    def _new_scrape_stats() -> Dict[str, int]:
+        """Create an empty statistics dict for a scraping run"""
+        return {
+            "total_found": 0,
+            "duplicates_removed": 0,
+            "sources_succeeded": 0,
+            "sources_failed": 0
+        }
+
+    def _record_scrape(self, scraper, articles, stats: Dict[str, int]) -> List[NewsArticle]:
+        """
+        Log the outcome of scraping one source.
+
+        Args:
+            scraper: Scraper that was run
+            articles: Scraped articles, or the exception the scraper raised
+            stats: Statistics dict to update
+
+        Returns:
+            Scraped articles (empty if the scraper failed)
+        """
+        if isinstance(articles, BaseException):
+            stats["sources_failed"] += 1
+            logger.error(f"Scraper {scraper.name} failed: {articles}")
+
+            self.db.log_scraping(
+                source=scraper.name,
+                status="failed",
+                errors=str(articles)
+            )
+            return []
+
+        stats["total_found"] += len(articles)
+        stats["sources_succeeded"] += 1
+
+        # Log scraping result
+        self.db.log_scraping(
+            source=scraper.name,
+            articles_found=len(articles),
+            status="completed"
+        )
+        return articles
 
+    def _finish_scrape(self, all_articles: List[NewsArticle], stats: Dict[str, int]) -> List[NewsArticle]:
+        """Deduplicate scraped articles and save them to the database"""
         # Deduplicate articles
         unique_articles = self._deduplicate(all_articles)
         stats["duplicates_removed"] = len(all_articles) - len(unique_articles)
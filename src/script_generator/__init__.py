@@ -2,6 +2,6 @@
 
 from .llm_client import LLMClient
 from .prompt_templates import PromptTemplates
-from .script_writer import ScriptWriter
+from .script_writer import ScriptWriter, VideoScript
 
-__all__ = ["LLMClient", "PromptTemplates", "ScriptWriter"]
+__all__ = ["LLMClient", "PromptTemplates", "ScriptWriter", "VideoScript"]
@@ -5,7 +5,7 @@ Script Writer - Generates complete video scripts from news articles
 import re
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 
 from .llm_client import LLMClient
 from .prompt_templates import PromptTemplates
@@ -45,6 +45,31 @@ class VideoScript:
     prelims_topics: List[str] = field(default_factory=list)
     mains_topics: List[str] = field(default_factory=list)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (used for caching)"""
+        data = asdict(self)
+        for segment in data["segments"]:
+            article = segment["article"]
+            if article and isinstance(article["published_at"], datetime):
+                article["published_at"] = article["published_at"].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoScript":
+        """Rebuild a script from the output of to_dict()"""
+        data = dict(data)
+        segments = []
+        for segment in data.pop("segments", []):
+            segment = dict(segment)
+            article = segment.get("article")
+            if article:
+                article = dict(article)
+                if article.get("published_at"):
+                    article["published_at"] = datetime.fromisoformat(article["published_at"])
+                segment["article"] = NewsArticle(**article)
+            segments.append(ScriptSegment(**segment))
+        return cls(segments=segments, **data)
+
     def get_full_script(self) -> str:
         """Get the full script as a single string"""
         parts = []
@@ -559,22 +584,27 @@ class ScriptWriter:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
+        # Assemble the whole file first so it is written in one call
+        parts = [
+            f"# {script.title}\n",
+            f"Date: {script.date}\n",
+            f"Language: {script.language}\n",
+            f"Duration: ~{script.total_duration/60:.1f} minutes\n",
+            f"Word Count: {script.word_count}\n",
+            f"Articles: {script.article_count}\n",
+            "\n" + "="*50 + "\n\n",
+        ]
+
+        for i, segment in enumerate(script.segments, 1):
+            parts.append(f"## Segment {i}: {segment.type.upper()}\n")
+            if segment.article:
+                parts.append(f"Source: {segment.article.source}\n")
+            parts.append(f"Duration: ~{segment.duration_estimate:.0f}s\n\n")
+            parts.append(segment.content)
+            parts.append("\n\n" + "-"*30 + "\n\n")
+
         with open(output_file, "w", encoding="utf-8") as f:
-            f.write(f"# {script.title}\n")
-            f.write(f"Date: {script.date}\n")
-            f.write(f"Language: {script.language}\n")
-            f.write(f"Duration: ~{script.total_duration/60:.1f} minutes\n")
-            f.write(f"Word Count: {script.word_count}\n")
-            f.write(f"Articles: {script.article_count}\n")
-            f.write("\n" + "="*50 + "\n\n")
-
-            for i, segment in enumerate(script.segments, 1):
-                f.write(f"## Segment {i}: {segment.type.upper()}\n")
-                if segment.article:
-                    f.write(f"Source: {segment.article.source}\n")
-                f.write(f"Duration: ~{segment.duration_estimate:.0f}s\n\n")
-                f.write(segment.content)
-                f.write("\n\n" + "-"*30 + "\n\n")
+            f.write("".join(parts))
 
         logger.info(f"Script saved to: {output_path}")
 
@@ -289,7 +289,7 @@ class EdgeTTSEngine(BaseTTS):
 
             # Stream audio + capture word boundaries for viseme lip-sync
             word_boundaries = []
-            audio_data = b""
+            audio_data = bytearray()
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
                     audio_data += chunk["data"]
@@ -409,11 +409,11 @@ class EdgeTTSEngine(BaseTTS):
                 temp_files.append(temp_path)
 
                 # Stream to capture word boundaries (retry up to 3 times)
-                chunk_audio = b""
+                chunk_audio = bytearray()
                 max_retries = 3
                 for attempt in range(max_retries):
                     try:
-                        chunk_audio = b""
+                        chunk_audio = bytearray()
                         communicate = edge_tts.Communicate(
                             text=chunk,
                             voice=voice,
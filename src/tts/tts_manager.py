@@ -8,11 +8,10 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
-import yaml
-
 from .edge_tts_engine import EdgeTTSEngine
 from .base_tts import TTSResult, TTSVoice
 from src.utils.logger import get_logger
+from src.utils.config import load_yaml
 
 logger = get_logger(__name__)
 
@@ -114,8 +113,7 @@ class TTSManager:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from file"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_yaml(config_path)
         except Exception as e:
             logger.warning(f"Failed to load config: {e}")
             return {}
@@ -3,5 +3,7 @@
 from .logger import setup_logger, get_logger
 from .database import Database
 from .scheduler import TaskScheduler
+from .llm_cache import LLMCache
+from .config import load_yaml, read_config
 
-__all__ = ["setup_logger", "get_logger", "Database", "TaskScheduler"]
+__all__ = ["setup_logger", "get_logger", "Database", "TaskScheduler", "LLMCache", "load_yaml", "read_config"]
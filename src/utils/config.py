@@ -0,0 +1,33 @@
+"""
+Config - YAML configuration loading
+"""
+
+import functools
+from typing import Any, Dict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+
+def load_yaml(path) -> Any:
+    """
+    Parse a YAML file, using libyaml's C loader when it is available.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed document
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+@functools.lru_cache(maxsize=4)
+def read_config(config_path: str) -> Dict[str, Any]:
+    """Parse a YAML config file (cached per path; errors are not cached)"""
+    return load_yaml(config_path)
@@ -218,6 +218,19 @@ class Database:
             session.commit()
             logger.info(f"Marked {len(article_ids)} articles as used in video: {video_id}")
 
+    def mark_urls_used(self, urls: List[str], video_id: str) -> None:
+        """Mark articles as used in a video, looked up by URL"""
+        hash_ids = [self.generate_hash(url) for url in urls]
+        with self.get_session() as session:
+            updated = session.query(Article).filter(
+                Article.hash_id.in_(hash_ids)
+            ).update(
+                {Article.is_used: True, Article.used_in_video: video_id},
+                synchronize_session=False
+            )
+            session.commit()
+            logger.info(f"Marked {updated} articles as used in video: {video_id}")
+
     def add_video(self, video_data: Dict[str, Any]) -> GeneratedVideo:
         """Add a new video record"""
         with self.get_session() as session:
@@ -0,0 +1,82 @@
+"""
+LLM Cache - Exact-match cache for LLM generated output
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LLMCache:
+    """
+    File-backed cache for LLM results.
+
+    Entries are stored as one JSON file per key, where the key is a SHA-256
+    of everything that determines the prompt (articles, language, date,
+    model settings). Re-running the pipeline on the same inputs then skips
+    the LLM calls entirely.
+    """
+
+    def __init__(self, cache_dir: str = "output/.script_cache"):
+        """
+        Initialize LLM cache.
+
+        Args:
+            cache_dir: Directory holding cached entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a cache key from the inputs that determine the LLM output"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached value, or None on a miss or unreadable entry
+        """
+        path = self._path(key)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path.name}: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Store an entry, replacing any previous value for the key.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable value
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path.name}: {e}")
@@ -8,8 +8,6 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
 from datetime import datetime
 
-import yaml
-
 # Configure moviepy to use ffmpeg from imageio-ffmpeg
 try:
     import imageio_ffmpeg
@@ -33,6 +31,7 @@ from .educational_effects import (
 )
 from .presentation_slides import PresentationSlideGenerator
 from src.utils.logger import get_logger
+from src.utils.config import load_yaml
 
 logger = get_logger(__name__)
 
@@ -110,8 +109,7 @@ class VideoComposer:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_yaml(config_path)
         except Exception as e:
             logger.warning(f"Failed to load config: {e}")
             return {}
@@ -255,7 +253,10 @@ class VideoComposer:
 
             ffmpeg_params = [
                 '-preset', preset,
-                '-threads', str(threads)
+                '-threads', str(threads),
+                # Put the moov atom first so YouTube can start processing
+                # the upload before the last chunk arrives
+                '-movflags', '+faststart'
             ]
 
             logger.info(f"Export settings: preset={preset}, threads={threads}, bitrate={bitrate}, resolution={self.resolution}")
@@ -6,9 +6,8 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 import re
 
-import yaml
-
 from src.utils.logger import get_logger
+from src.utils.config import load_yaml
 
 logger = get_logger(__name__)
 
@@ -36,8 +35,7 @@ class MetadataGenerator:
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load YouTube configuration"""
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
+            return load_yaml(config_path)
         except Exception as e:
             logger.warning(f"Failed to load config: {e}")
             return {}
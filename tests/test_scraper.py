@@ -2,12 +2,15 @@
 Tests for News Scraper Module
 """
 
+import asyncio
+import time
 import pytest
 from datetime import datetime
 
 from src.scraper.base_scraper import NewsArticle
 from src.scraper.rss_scraper import RSSScraper
 from src.scraper.news_aggregator import NewsAggregator
+from src.utils.database import Database
 
 
 class TestNewsArticle:
@@ -71,6 +74,24 @@ class TestRSSScraper:
         assert cleaned == "Multiple spaces here"
 
 
+class FakeScraper:
+    """Scraper stand-in returning canned articles (or raising if none)"""
+
+    def __init__(self, name, titles=None, delay=0.0):
+        self.name = name
+        self.titles = titles
+        self.delay = delay
+
+    def scrape(self):
+        time.sleep(self.delay)
+        if self.titles is None:
+            raise RuntimeError("feed unavailable")
+        return [
+            NewsArticle(title=t, url=f"https://example.com/{t}", source=self.name)
+            for t in self.titles
+        ]
+
+
 class TestNewsAggregator:
     """Tests for News Aggregator"""
 
@@ -90,6 +111,36 @@ class TestNewsAggregator:
         assert "total_scrapers" in stats
         assert "total_articles" in stats
 
+    def test_scrape_all_async_matches_sync(self, tmp_path):
+        """Test concurrent scraping keeps source order and skips failures"""
+        aggregator = NewsAggregator(database=Database(str(tmp_path / "news.db")))
+        aggregator.scrapers = [
+            FakeScraper("A", ["Budget session opens", "Monsoon arrives early"], delay=0.2),
+            FakeScraper("B"),
+            FakeScraper("C", ["Budget session opens", "ISRO launches satellite"]),
+        ]
+
+        articles = asyncio.run(aggregator.scrape_all_async(max_concurrency=2))
+
+        assert [a.title for a in articles] == [
+            "Budget session opens",
+            "Monsoon arrives early",
+            "ISRO launches satellite",
+        ]
+        assert [a.url for a in articles] == [a.url for a in aggregator.scrape_all()]
+
+    def test_scrape_all_async_timeout_drops_slow_sources(self, tmp_path):
+        """Test sources still running at the timeout are skipped"""
+        aggregator = NewsAggregator(database=Database(str(tmp_path / "news.db")))
+        aggregator.scrapers = [
+            FakeScraper("Fast", ["Monsoon arrives early"]),
+            FakeScraper("Slow", ["ISRO launches satellite"], delay=1.0),
+        ]
+
+        articles = asyncio.run(aggregator.scrape_all_async(timeout=0.3))
+
+        assert [a.title for a in articles] == ["Monsoon arrives early"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])